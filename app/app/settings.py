@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/3.2/ref/settings/
 
 from pathlib import Path
 import os
+import sys
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -55,6 +56,31 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+TESTING = 'test' in sys.argv or 'pytest' in sys.modules
+
+if TESTING:
+    # Fail tests on lazy loads of unprefetched relations (N+1 queries).
+    from nplusone.core.exceptions import NPlusOneError
+
+    INSTALLED_APPS += ['nplusone.ext.django']
+    MIDDLEWARE.insert(0, 'nplusone.ext.django.NPlusOneMiddleware')
+    NPLUSONE_RAISE = True
+    NPLUSONE_ERROR = NPlusOneError
+
+    # Password hashing dominates user creation in tests; use a cheap hasher.
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+    class DisableMigrations:
+        """Build the test schema from the models instead of migrations"""
+
+        def __contains__(self, item):
+            return True
+
+        def __getitem__(self, item):
+            return None
+
+    MIGRATION_MODULES = DisableMigrations()
+
 ROOT_URLCONF = 'app.urls'
 
 TEMPLATES = [
@@ -0,0 +1,20 @@
+"""
+Pytest configuration for the test suite
+"""
+import pytest
+from django.test import TestCase, TransactionTestCase
+
+
+def pytest_runtest_setup(item):
+    """Fail tests that would flush the database instead of rolling back"""
+    cls = getattr(item, 'cls', None)
+    if (
+        cls is not None
+        and issubclass(cls, TransactionTestCase)
+        and not issubclass(cls, TestCase)
+    ):
+        pytest.fail(
+            f'{cls.__name__} flushes the database after every test; '
+            'use django.test.TestCase instead',
+            pytrace=False,
+        )
@@ -8,19 +8,22 @@ from django.test import Client
 class AdminSiteTests(TestCase):
     """Tests for the Django admin site"""
 
-    def setUp(self):
-        self.client = Client()
-        self.admin_user = get_user_model().objects.create_superuser(
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = get_user_model().objects.create_superuser(
             email='admin@example.com',
             password='testpass123',
         )
-        self.client.force_login(self.admin_user)
-        self.user = get_user_model().objects.create_user(
+        cls.user = get_user_model().objects.create_user(
             email='user@example.com',
             password='testpass123',
             name='Test User',
         )
 
+    def setUp(self):
+        self.client = Client()
+        self.client.force_login(self.admin_user)
+
     def test_users_list(self):
         """Test that users are listed on user page"""
         url = reverse('admin:core_user_changelist')
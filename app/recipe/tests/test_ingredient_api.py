@@ -1,6 +1,7 @@
 """
 Testsf for the ingredient API
 """
+from functools import lru_cache
 from decimal import Decimal
 from django.urls import reverse
 from django.test import TestCase
@@ -13,6 +14,7 @@ from django.contrib.auth import get_user_model
 
 INGREDIENTS_URL = reverse('recipe:ingredient-list')
 
+@lru_cache(maxsize=None)
 def detail_url(ingredient_id):
     """Return ingredient detail URL"""
     return reverse('recipe:ingredient-detail', args=[ingredient_id])
@@ -23,9 +25,7 @@ def create_user (email='user@example.com', password='test123'):
 
 class PublicIngredientApiTests(TestCase):
     """Test unauthenticated ingredient API access"""
-
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_auth_required(self):
         """Test that authentication is required"""
@@ -34,10 +34,13 @@ class PublicIngredientApiTests(TestCase):
 
 class PrivateIngredientApiTests(TestCase):
     """Test authenticated ingredient API access"""
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
 
     def setUp(self):
-        self.client = APIClient()
-        self.user = create_user()
         self.client.force_authenticate(self.user)
 
     def test_retrieve_ingredients(self):
@@ -45,7 +48,8 @@ class PrivateIngredientApiTests(TestCase):
         Ingredient.objects.create(user=self.user, name='Kale')
         Ingredient.objects.create(user=self.user, name='Salt')
 
-        res = self.client.get(INGREDIENTS_URL)
+        with self.assertNumQueries(1):
+            res = self.client.get(INGREDIENTS_URL)
 
         ingredients = Ingredient.objects.all().order_by('-name')
         serializer = IngredientSerializer(ingredients, many=True)
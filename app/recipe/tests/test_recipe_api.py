@@ -1,6 +1,7 @@
 """
 Tests for recipe API
 """
+from functools import lru_cache
 from django.urls import reverse
 import tempfile
 import os
@@ -16,64 +17,85 @@ from recipe.serializers import RecipeSerializer, RecipeDetailSerializer
 RECIPES_URL = reverse('recipe:recipe-list')
 
 
+@lru_cache(maxsize=None)
 def detail_url(recipe_id):
     """Return recipe detail URL"""
     return reverse('recipe:recipe-detail', args=[recipe_id])
 
+@lru_cache(maxsize=None)
 def image_upload_url(recipe_id):
     """Return URL for recipe image upload"""
     return reverse('recipe:recipe-upload-image', args=[recipe_id])
 
+RECIPE_DEFAULTS = {
+    'title': 'Sample recipe',
+    'time_minutes': 10,
+    'price': Decimal('5.00'),
+    'description': 'Sample description',
+    'link': 'https://example.com/recpe.pdf'
+}
+
 def create_recipe(user, **params):
     """Create and return a sample recipe"""
-    defaults = {
-        'title': 'Sample recipe',
-        'time_minutes': 10,
-        'price': Decimal('5.00'),
-        'description': 'Sample description',
-        'link': 'https://example.com/recpe.pdf'
-
-    }
-    defaults.update(params)
+    defaults = {**RECIPE_DEFAULTS, **params}
 
     return Recipe.objects.create(user=user, **defaults)
 
+def bulk_create_recipes(user, n, **params):
+    """Create and return n sample recipes with a single INSERT"""
+    defaults = {**RECIPE_DEFAULTS, **params}
+
+    return Recipe.objects.bulk_create(
+        [Recipe(user=user, **defaults) for _ in range(n)]
+    )
+
 def create_user(**params):
     """Create a sample user"""
     return get_user_model().objects.create_user(**params)
 
+def recipe_list_data(recipe):
+    """Return the expected list payload for a recipe without tags/ingredients"""
+    return {
+        'id': recipe.id,
+        'title': recipe.title,
+        'time_minutes': recipe.time_minutes,
+        'price': str(recipe.price),
+        'link': recipe.link,
+        'tags': [],
+        'ingredients': [],
+    }
+
 class PublicRecipeApiTests(TestCase):
     """Test unauthenticated recipe API access"""
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_auth_required(self):
         """Test that authentication is required"""
-        res = self.client.get(reverse('recipe:recipe-list'))
+        res = self.client.get(RECIPES_URL)
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 class PrivateRecipeApiTests(TestCase):
     """Test authenticated recipe API access"""
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(email='user@example.com', password='test123')
+
     def setUp(self):
-        self.client = APIClient()
-        self.user = create_user(email='user@example.com', password='test123')
-        self.user = get_user_model().objects.create_user(
-            'user3@example.com',
-            'testpass'
-        )
         self.client.force_authenticate(self.user)
 
     def test_retrieve_recipes(self):
         """Test retrieving a list of recipes"""
-        create_recipe(user=self.user)
-        create_recipe(user=self.user)
+        recipes = bulk_create_recipes(self.user, 10)
 
-        res = self.client.get(RECIPES_URL)
-        recipes = Recipe.objects.all().order_by('-id')
-        serializer = RecipeSerializer(recipes, many=True)
+        # Recipes, tags and ingredients: constant regardless of recipe count.
+        with self.assertNumQueries(3):
+            res = self.client.get(RECIPES_URL)
 
+        expected = [recipe_list_data(recipe) for recipe in reversed(recipes)]
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(res.data, expected)
 
     def test_recipes_limited_to_user(self):
         """Test retrieving recipes for user"""
@@ -82,21 +104,19 @@ class PrivateRecipeApiTests(TestCase):
             password = 'testpass'
         )
         create_recipe(user=user2)
-        create_recipe(user=self.user)
+        recipe = create_recipe(user=self.user)
 
         res = self.client.get(RECIPES_URL)
 
-        recipes = Recipe.objects.filter(user=self.user)
-        serializer = RecipeSerializer(recipes, many=True)
-
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(res.data, [recipe_list_data(recipe)])
 
     def test_get_recipe_detail(self):
         """Test getting recipe detail"""
         recipe = create_recipe(user=self.user)
         url = detail_url(recipe.id)
-        res = self.client.get(url)
+        with self.assertNumQueries(3):
+            res = self.client.get(url)
         serializer = RecipeDetailSerializer(recipe)
         self.assertEqual(res.data, serializer.data)
 
@@ -105,13 +125,14 @@ class PrivateRecipeApiTests(TestCase):
         payload = {
             'title': 'Chocolate cheesecake',
             'time_minutes': 30,
-            'price': Decimal('5.00')
+            'price': '5.00'
         }
         res = self.client.post(RECIPES_URL, payload)
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
         recipe = Recipe.objects.get(id=res.data['id'])
-        for key in payload.keys():
-            self.assertEqual(payload[key], getattr(recipe, key))
+        for key, value in payload.items():
+            attr = getattr(recipe, key)
+            self.assertEqual(value, str(attr) if key == 'price' else attr)
         self.assertEqual(recipe.user, self.user)
 
     def test_partial_update(self):
@@ -145,7 +166,7 @@ class PrivateRecipeApiTests(TestCase):
         payload = {
             'title': 'spaghetti carbonara',
             'time_minutes': 25,
-            'price': Decimal('12.00'),
+            'price': '12.00',
             'description': 'new description',
             'link': 'https://example.com/recipe2.pdf'
         }
@@ -154,8 +175,9 @@ class PrivateRecipeApiTests(TestCase):
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         recipe.refresh_from_db()
-        for key in payload.keys():
-            self.assertEqual(payload[key], getattr(recipe, key))
+        for key, value in payload.items():
+            attr = getattr(recipe, key)
+            self.assertEqual(value, str(attr) if key == 'price' else attr)
         self.assertEqual(recipe.user, self.user)
 
     def test_update_user_returns_error(self):
@@ -194,7 +216,7 @@ class PrivateRecipeApiTests(TestCase):
         payload = {
             'title': 'Avocado lime cheesecake',
             'time_minutes': 60,
-            'price': Decimal('20.00'),
+            'price': '20.00',
             'tags': [{'name': 'vegan'}, {'name': 'dessert'}]
         }
         res = self.client.post(RECIPES_URL, payload, format='json')
@@ -214,7 +236,7 @@ class PrivateRecipeApiTests(TestCase):
         payload = {
             'title': 'Avocado lime cheesecake',
             'time_minutes': 60,
-            'price': Decimal('20.00'),
+            'price': '20.00',
             'tags': [{'name': 'vegan'}, {'name': 'dessert'}]
         }
         res = self.client.post(RECIPES_URL, payload, format='json')
@@ -281,7 +303,7 @@ class PrivateRecipeApiTests(TestCase):
         payload = {
             'title': 'Avocado lime cheesecake',
             'time_minutes': 60,
-            'price': Decimal('20.00'),
+            'price': '20.00',
             'ingredients': [{'name': 'avocado'}, {'name': 'lime'}]
         }
         res = self.client.post(RECIPES_URL, payload, format='json')
@@ -301,7 +323,7 @@ class PrivateRecipeApiTests(TestCase):
         payload = {
             'title': 'Avocado lime cheesecake',
             'time_minutes': 60,
-            'price': Decimal('20.00'),
+            'price': '20.00',
             'ingredients': [{'name': 'avocado'}, {'name': 'lime'}]
         }
         res = self.client.post(RECIPES_URL, payload, format='json')
@@ -412,12 +434,13 @@ class PrivateRecipeApiTests(TestCase):
 
 class ImageUploadTests(TestCase):
     """Test image upload"""
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(email='example@user.com', password='test123')
+
     def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
-            'example@user.com',
-            'test123'
-        )
         self.client.force_authenticate(self.user)
         self.recipe = create_recipe(user=self.user)
 
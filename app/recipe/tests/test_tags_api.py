@@ -1,6 +1,7 @@
 """
 Tests for the tags API
 """
+from functools import lru_cache
 from decimal import Decimal
 from django.contrib.auth import get_user_model
 from django.urls import reverse
@@ -14,6 +15,7 @@ from recipe.serializers import TagSerializer
 
 TAGS_URL = reverse('recipe:tag-list')
 
+@lru_cache(maxsize=None)
 def detail_url(tag_id):
     """Return tag detail URL"""
     return reverse('recipe:tag-detail', args=[tag_id])
@@ -24,9 +26,7 @@ def create_user(email='user@example.com', password='test123'):
 
 class PublicTagsApiTests(TestCase):
     """Test the publicly available tags API"""
-
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_login_required(self):
         """Test that login is required for retrieving tags"""
@@ -36,10 +36,13 @@ class PublicTagsApiTests(TestCase):
 
 class PrivateTagsApiTests(TestCase):
     """Test the authorized user tags API"""
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
 
     def setUp(self):
-        self.user = create_user()
-        self.client = APIClient()
         self.client.force_authenticate(self.user)
 
     def test_retrieve_tags(self):
@@ -47,7 +50,8 @@ class PrivateTagsApiTests(TestCase):
         Tag.objects.create(user=self.user, name='Vegan')
         Tag.objects.create(user=self.user, name='Dessert')
 
-        res = self.client.get(TAGS_URL)
+        with self.assertNumQueries(1):
+            res = self.client.get(TAGS_URL)
 
         tags = Tag.objects.all().order_by('-name')
         serializer = TagSerializer(tags, many=True)
@@ -7,6 +7,7 @@ from drf_spectacular.utils import (
     OpenApiParameter,
     OpenApiTypes
     )
+from django.db.models import Exists, OuterRef
 from rest_framework import viewsets, mixins, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -58,6 +59,15 @@ class RecipeViewSet(viewsets.ModelViewSet):
             ingredient_ids = self._params_to_ints(ingredients)
             queryset = queryset.filter(ingredients__id__in=ingredient_ids)
 
+        if self.action in ('list', 'retrieve'):
+            queryset = queryset.prefetch_related('tags', 'ingredients')
+        if self.action == 'list':
+            # Only load the columns RecipeSerializer renders; accessing a
+            # deferred field (e.g. description) costs one query per recipe.
+            queryset = queryset.only(
+                'id', 'title', 'time_minutes', 'price', 'link'
+            )
+
         return queryset.filter(user=self.request.user).order_by('-id').distinct()
 
     def perform_create(self, serializer):
@@ -73,10 +83,6 @@ class RecipeViewSet(viewsets.ModelViewSet):
 
         return self.serializer_class
 
-    def perform_create(self, serializer):
-        """Create a new recipe"""
-        serializer.save(user=self.request.user)
-
     @action(methods=['POST'], detail=True, url_path='upload-image')
     def upload_image(self, request, pk=None):
         """Upload an image to a recipe"""
@@ -98,7 +104,7 @@ class RecipeViewSet(viewsets.ModelViewSet):
             status=status.HTTP_400_BAD_REQUEST
         )
 
-extend_schema_view(
+@extend_schema_view(
     list=extend_schema(
         parameters=[
             OpenApiParameter(
@@ -109,7 +115,6 @@ extend_schema_view(
         ]
     )
 )
-
 class BaseRecipeAttrViewSet(mixins.UpdateModelMixin,
                             mixins.DestroyModelMixin,
                             mixins.ListModelMixin,
@@ -118,6 +123,8 @@ class BaseRecipeAttrViewSet(mixins.UpdateModelMixin,
     """Base viewset for user owned recipe attributes"""
     authentication_classes = [TokenAuthentication]
     permission_classes = [IsAuthenticated]
+    # Name of the Recipe many-to-many field pointing at this model.
+    recipe_field = None
 
     def get_queryset(self):
         """Return objects for the current authenticated user only"""
@@ -126,8 +133,11 @@ class BaseRecipeAttrViewSet(mixins.UpdateModelMixin,
         )
         queryset = self.queryset
         if assigned_only:
-            queryset = queryset.filter(recipe__isnull=False)
-        return queryset.filter(user=self.request.user).order_by('-name').distinct()
+            # Semi-join on the recipe relation; avoids DISTINCT over a JOIN.
+            queryset = queryset.filter(Exists(
+                Recipe.objects.filter(**{self.recipe_field: OuterRef('pk')})
+            ))
+        return queryset.filter(user=self.request.user).order_by('-name')
 
     def perform_create(self, serializer):
         """Create a new object"""
@@ -137,9 +147,11 @@ class TagViewSet( BaseRecipeAttrViewSet):
     """Manage tags in the database"""
     queryset = Tag.objects.all()
     serializer_class = serializers.TagSerializer
+    recipe_field = 'tags'
 
 class IngredientViewSet( BaseRecipeAttrViewSet):
     """Manage ingredients in the database"""
     queryset = Ingredient.objects.all()
     serializer_class = serializers.IngredientSerializer
+    recipe_field = 'ingredients'
 
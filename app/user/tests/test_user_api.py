@@ -21,9 +21,7 @@ def create_user(**params):
 
 class PublicUserApiTests(TestCase):
     """Test the user API (public)"""
-
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_create_user_success(self):
         """Test creating user with valid payload is successful"""
@@ -111,14 +109,17 @@ class PublicUserApiTests(TestCase):
 
 class PrivateUserApiTests(TestCase):
     """Test API requests that require authentication"""
+    client_class = APIClient
 
-    def setUp(self):
-        self.user = create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email='test@example.com',
             password='testpass123',
             name='Test Name'
         )
-        self.client = APIClient()
+
+    def setUp(self):
         self.client.force_authenticate(user=self.user)
     
     def test_retrieve_profile_success(self):